@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import warnings
 from typing import Any
 from typing import Callable
@@ -73,6 +74,7 @@ def iter_entry_points(
     return (ep for ep in eps if ep.name == name)
 
 
+@functools.lru_cache(maxsize=None)
 def _get_ep(group: str, name: str) -> Any | None:
     from ._entrypoints import iter_entry_points
 
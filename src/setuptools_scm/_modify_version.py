@@ -4,6 +4,8 @@ import re
 
 from . import _types as _t
 
+_TRAILING_NUMBER_REGEX = re.compile(r"(.*?)(\d+)$")
+
 
 def _strip_local(version_string: str) -> str:
     public, sep, local = version_string.partition("+")
@@ -34,7 +36,7 @@ def _bump_dev(version: str) -> str | None:
 
 
 def _bump_regex(version: str) -> str:
-    match = re.match(r"(.*?)(\d+)$", version)
+    match = _TRAILING_NUMBER_REGEX.match(version)
     if match is None:
         raise ValueError(
             "{version} does not end with a number to bump, "
@@ -57,5 +59,5 @@ def _format_local_with_time(version: _t.SCMVERSION, time_format: str) -> str:
 
 
 def _dont_guess_next_version(tag_version: _t.SCMVERSION) -> str:
-    version = _strip_local(str(tag_version.tag))
+    version = _strip_local(tag_version.tag_str)
     return _bump_dev(version) or _add_post(version)
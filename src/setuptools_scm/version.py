@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import os
 import re
+import sys
 import warnings
 from datetime import date
 from datetime import datetime
@@ -10,6 +12,7 @@ from datetime import timezone
 from typing import Any
 from typing import Callable
 from typing import Match
+from typing import Pattern
 from typing import TYPE_CHECKING
 
 from . import _entrypoints
@@ -24,10 +27,10 @@ if TYPE_CHECKING:
 
     from . import _types as _t
 
-
 from ._version_cls import Version as PkgVersion, _VersionT
 from . import _version_cls as _v
 from . import _config
+from . import utils
 from .utils import trace
 
 SEMVER_MINOR = 2
@@ -35,27 +38,30 @@ SEMVER_PATCH = 3
 SEMVER_LEN = 3
 
 
+def _tagdict_from_match(match: Match[str] | None) -> dict[str, str] | None:
+    if not match:
+        return None
+    key: str | int
+    if len(match.groups()) == 1:
+        key = 1
+    else:
+        key = "version"
+
+    return {
+        "version": match.group(key),
+        "prefix": match.group(0)[: match.start(key)],
+        "suffix": match.group(0)[match.end(key) :],
+    }
+
+
 def _parse_version_tag(
     tag: str | object, config: _config.Configuration
 ) -> dict[str, str] | None:
     tagstring = tag if isinstance(tag, str) else str(tag)
-    match = config.tag_regex.match(tagstring)
+    result = _tagdict_from_match(config.tag_regex.match(tagstring))
 
-    result = None
-    if match:
-        key: str | int
-        if len(match.groups()) == 1:
-            key = 1
-        else:
-            key = "version"
-
-        result = {
-            "version": match.group(key),
-            "prefix": match.group(0)[: match.start(key)],
-            "suffix": match.group(0)[match.end(key) :],
-        }
-
-    trace(f"tag '{tag}' parsed to {result}")
+    if utils.DEBUG:
+        trace(f"tag '{tag}' parsed to {result}")
     return result
 
 
@@ -64,11 +70,32 @@ def callable_or_entrypoint(group: str, callable_or_name: str | Any) -> Any:
 
     if callable(callable_or_name):
         return callable_or_name
-    from ._entrypoints import iter_entry_points
+    return _entrypoints._get_ep(group, callable_or_name)
+
 
-    for ep in iter_entry_points(group, callable_or_name):
-        trace("ep found:", ep.name)
-        return ep.load()
+def _parse_tag_to_version(
+    tag_str: str, version_cls: type[_VersionT], tag_regex: Pattern[str]
+) -> tuple[dict[str, str] | None, _VersionT | None]:
+    """
+    parse a tag string into (tag parts, version)
+
+    the version is None if the tag has no version part,
+    warnings and traces are left to tag_to_version
+    """
+    tagdict = _tagdict_from_match(tag_regex.match(tag_str))
+    if not tagdict or not tagdict["version"]:
+        return tagdict, None
+    return tagdict, version_cls(tagdict["version"])
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_parse_tag_to_version(
+    tag_str: str, normalize: bool, tag_regex: Pattern[str]
+) -> tuple[dict[str, str] | None, _VersionT | None]:
+    # only used for the builtin version classes,
+    # their instances are immutable and can be shared between callers
+    version_cls = _v.Version if normalize else _v.NonNormalizedVersion
+    return _parse_tag_to_version(tag_str, version_cls, tag_regex)
 
 
 def tag_to_version(
@@ -79,36 +106,52 @@ def tag_to_version(
     """
     trace("tag", tag)
 
-    tagdict = _parse_version_tag(tag, config)
-    if not isinstance(tagdict, dict) or not tagdict.get("version", None):
+    tag_str = tag if isinstance(tag, str) else str(tag)
+    version_cls = config.version_cls
+    if version_cls is _v.Version or version_cls is _v.NonNormalizedVersion:
+        tagdict, version = _cached_parse_tag_to_version(
+            tag_str, version_cls is _v.Version, config.tag_regex
+        )
+    else:
+        tagdict, version = _parse_tag_to_version(tag_str, version_cls, config.tag_regex)
+    if utils.DEBUG:
+        trace(f"tag '{tag}' parsed to {tagdict}")
+    if tagdict is None or version is None:
         warnings.warn(f"tag {tag!r} no version found")
         return None
 
-    version_str = tagdict["version"]
-    trace("version pre parse", version_str)
+    trace("version pre parse", tagdict["version"])
 
-    if tagdict.get("suffix", ""):
+    if tagdict["suffix"]:
         warnings.warn(
-            "tag {!r} will be stripped of its suffix '{}'".format(
-                tag, tagdict["suffix"]
-            )
+            f"tag {tag!r} will be stripped of its suffix '{tagdict['suffix']}'"
         )
 
-    version: _VersionT = config.version_cls(version_str)
-    trace("version", repr(version))
+    if utils.DEBUG:
+        trace("version", repr(version))
 
     return version
 
 
+@functools.lru_cache(maxsize=1)
+def _source_epoch(date_epoch: str) -> datetime:
+    return datetime.fromtimestamp(int(date_epoch), timezone.utc)
+
+
 def _source_epoch_or_utc_now() -> datetime:
     if "SOURCE_DATE_EPOCH" in os.environ:
-        date_epoch = int(os.environ["SOURCE_DATE_EPOCH"])
-        return datetime.fromtimestamp(date_epoch, timezone.utc)
+        return _source_epoch(os.environ["SOURCE_DATE_EPOCH"])
     else:
         return datetime.now(timezone.utc)
 
 
-@dataclasses.dataclass
+# dataclass slots are only available on python 3.10+
+_DATACLASS_SLOTS: dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
 class ScmVersion:
     tag: _v.Version | _v.NonNormalizedVersion | str
     config: _config.Configuration
@@ -130,10 +173,14 @@ class ScmVersion:
     def exact(self) -> bool:
         return self.distance is None
 
+    @property
+    def tag_str(self) -> str:
+        return str(self.tag)
+
     def __repr__(self) -> str:
-        return self.format_with(
-            "<ScmVersion {tag} dist={distance} "
-            "node={node} dirty={dirty} branch={branch}>"
+        return (
+            f"<ScmVersion {self.tag} dist={self.distance} "
+            f"node={self.node} dirty={self.dirty} branch={self.branch}>"
         )
 
     def format_with(self, fmt: str, **kw: object) -> str:
@@ -162,19 +209,6 @@ class ScmVersion:
         return self.format_with(fmt, guessed=guessed)
 
 
-def _parse_tag(
-    tag: _VersionT | str, preformatted: bool, config: _config.Configuration
-) -> _VersionT | str:
-    if preformatted:
-        return tag
-    elif not isinstance(tag, config.version_cls):
-        version = tag_to_version(tag, config)
-        assert version is not None
-        return version
-    else:
-        return tag
-
-
 def meta(
     tag: str | _VersionT,
     *,
@@ -186,9 +220,13 @@ def meta(
     config: _config.Configuration,
     node_date: date | None = None,
 ) -> ScmVersion:
-    parsed_version = _parse_tag(tag, preformatted, config)
+    parsed_version: _VersionT | str | None
+    if preformatted or isinstance(tag, config.version_cls):
+        parsed_version = tag
+    else:
+        parsed_version = tag_to_version(tag, config)
     trace("version", tag, "->", parsed_version)
-    assert parsed_version is not None, "Can't parse version %s" % tag
+    assert parsed_version is not None, f"Can't parse version {tag}"
     return ScmVersion(
         parsed_version,
         distance=distance,
@@ -201,11 +239,15 @@ def meta(
     )
 
 
-def guess_next_version(tag_version: ScmVersion) -> str:
-    version = _strip_local(str(tag_version.tag))
+@functools.lru_cache(maxsize=256)
+def _guess_next_from_str(version: str) -> str:
     return _bump_dev(version) or _bump_regex(version)
 
 
+def guess_next_version(tag_version: ScmVersion) -> str:
+    return _guess_next_from_str(_strip_local(tag_version.tag_str))
+
+
 def guess_next_dev_version(version: ScmVersion) -> str:
     if version.exact:
         return version.format_with("{tag}")
@@ -213,20 +255,22 @@ def guess_next_dev_version(version: ScmVersion) -> str:
         return version.format_next_version(guess_next_version)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_int_parts(tag_str: str, retain: int) -> tuple[int, ...]:
+    return tuple(int(i) for i in tag_str.split(".", retain)[:retain])
+
+
 def guess_next_simple_semver(
     version: ScmVersion, retain: int, increment: bool = True
 ) -> str:
     try:
-        parts = [int(i) for i in str(version.tag).split(".")[:retain]]
+        parts = list(_parse_int_parts(version.tag_str, retain))
     except ValueError:
         raise ValueError(f"{version} can't be parsed as numeric version")
-    while len(parts) < retain:
-        parts.append(0)
+    parts += [0] * (max(retain, SEMVER_LEN) - len(parts))
     if increment:
-        parts[-1] += 1
-    while len(parts) < SEMVER_LEN:
-        parts.append(0)
-    return ".".join(str(i) for i in parts)
+        parts[retain - 1] += 1
+    return ".".join(map(str, parts))
 
 
 def simplified_semver_version(version: ScmVersion) -> str:
@@ -243,14 +287,23 @@ def simplified_semver_version(version: ScmVersion) -> str:
             )
 
 
+@functools.lru_cache(maxsize=256)
+def _up_to_minor(version_str: str) -> tuple[str, ...]:
+    return tuple(version_str.split(".", SEMVER_MINOR)[:SEMVER_MINOR])
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_branch_leaf(branch: str, tag_regex: Pattern[str]) -> dict[str, str] | None:
+    # the branch name stripped of its namespace, parsed like a tag
+    return _tagdict_from_match(tag_regex.match(branch.rpartition("/")[2]))
+
+
 def release_branch_semver_version(version: ScmVersion) -> str:
     if version.exact:
         return version.format_with("{tag}")
     if version.branch is not None:
         # Does the branch name (stripped of namespace) parse as a version?
-        branch_ver_data = _parse_version_tag(
-            version.branch.split("/")[-1], version.config
-        )
+        branch_ver_data = _parse_branch_leaf(version.branch, version.config.tag_regex)
         if branch_ver_data is not None:
             branch_ver = branch_ver_data["version"]
             if branch_ver[0] == "v":
@@ -259,9 +312,7 @@ def release_branch_semver_version(version: ScmVersion) -> str:
             # Does the branch version up to the minor part match the tag? If not it
             # might be like, an issue number or something and not a version number, so
             # we only want to use it if it matches.
-            tag_ver_up_to_minor = str(version.tag).split(".")[:SEMVER_MINOR]
-            branch_ver_up_to_minor = branch_ver.split(".")[:SEMVER_MINOR]
-            if branch_ver_up_to_minor == tag_ver_up_to_minor:
+            if _up_to_minor(branch_ver) == _up_to_minor(version.tag_str):
                 # We're in a release/maintenance branch, next is a patch/rc/beta bump:
                 return version.format_next_version(guess_next_version)
     # We're in a development branch, next is a minor bump:
@@ -288,10 +339,31 @@ def no_guess_dev_version(version: ScmVersion) -> str:
 _DATE_REGEX = re.compile(
     r"^(?P<date>(?P<year>\d{2}|\d{4})(?:\.\d{1,2}){2})(?:\.(?P<patch>\d*))?$"
 )
+_date_match = _DATE_REGEX.match
 
 
 def date_ver_match(ver: str) -> Match[str] | None:
-    return _DATE_REGEX.match(ver)
+    return _date_match(ver)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_tag_and_date(
+    tag_str: str, tag_regex: Pattern[str]
+) -> tuple[dict[str, str] | None, Match[str] | None]:
+    """
+    parse a tag and match its version part against the calver date pattern
+
+    both regexes run once per tag string and tag regex
+    """
+    tagdict = _tagdict_from_match(tag_regex.match(tag_str))
+    if tagdict is None:
+        return None, None
+    return tagdict, _date_match(tagdict["version"])
+
+
+@functools.lru_cache(maxsize=8)
+def _strptime_date(date_str: str, date_fmt: str) -> date:
+    return datetime.strptime(date_str, date_fmt).date()
 
 
 def guess_next_date_ver(
@@ -306,7 +378,7 @@ def guess_next_date_ver(
 
     distance is always added as .devX
     """
-    match = date_ver_match(str(version.tag))
+    match = date_ver_match(version.tag_str)
     if match is None:
         warnings.warn(
             f"{version} does not correspond to a valid versioning date, "
@@ -315,31 +387,28 @@ def guess_next_date_ver(
         if date_fmt is None:
             date_fmt = "%y.%m.%d"
     else:
+        date_str, year_str, patch_str = match.group(1, 2, 3)
         # deduct date format if not provided
         if date_fmt is None:
-            date_fmt = "%Y.%m.%d" if len(match.group("year")) == 4 else "%y.%m.%d"
+            date_fmt = "%Y.%m.%d" if len(year_str) == 4 else "%y.%m.%d"
     today = datetime.now(timezone.utc).date()
     head_date = node_date or today
     # compute patch
     if match is None:
         tag_date = today
     else:
-        tag_date = datetime.strptime(match.group("date"), date_fmt).date()
+        tag_date = _strptime_date(date_str, date_fmt)
     if tag_date == head_date:
-        patch = "0" if match is None else (match.group("patch") or "0")
+        patch = "0" if match is None else (patch_str or "0")
         patch = int(patch) + 1
     else:
         if tag_date > head_date and match is not None:
             # warn on future times
             warnings.warn(
-                "your previous tag  ({}) is ahead your node date ({})".format(
-                    tag_date, head_date
-                )
+                f"your previous tag  ({tag_date}) is ahead your node date ({head_date})"
             )
         patch = 0
-    next_version = "{node_date:{date_fmt}}.{patch}".format(
-        node_date=head_date, date_fmt=date_fmt, patch=patch
-    )
+    next_version = f"{head_date:{date_fmt}}.{patch}"
     # rely on the Version object to ensure consistency (e.g. remove leading 0s)
     if version_cls is None:
         version_cls = PkgVersion
@@ -352,12 +421,11 @@ def calver_by_date(version: ScmVersion) -> str:
         return version.format_with("{tag}")
     # TODO: move the release-X check to a new scheme
     if version.branch is not None and version.branch.startswith("release-"):
-        branch_ver = _parse_version_tag(version.branch.split("-")[-1], version.config)
-        if branch_ver is not None:
-            ver = branch_ver["version"]
-            match = date_ver_match(ver)
-            if match:
-                return ver
+        branch_ver, match = _parse_tag_and_date(
+            version.branch.rpartition("-")[2], version.config.tag_regex
+        )
+        if branch_ver is not None and match:
+            return branch_ver["version"]
     return version.format_next_version(
         guess_next_date_ver,
         node_date=version.node_date,
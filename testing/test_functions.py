@@ -105,3 +105,26 @@ def test_has_command() -> None:
 def test_tag_to_version(tag: str, expected_version: str) -> None:
     version = str(tag_to_version(tag, c))
     assert version == expected_version
+
+
+def test_tag_to_version_cached_still_warns() -> None:
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="will be stripped of its suffix"):
+            version = tag_to_version("1.2+local", c)
+        assert str(version) == "1.2"
+
+
+def test_tag_to_version_custom_version_cls_not_shared() -> None:
+    class MutableVersion:
+        def __init__(self, tag_str: str):
+            self.tag = tag_str
+
+    config = Configuration(version_cls=MutableVersion)  # type: ignore[arg-type]
+    assert tag_to_version("1.0", config) is not tag_to_version("1.0", config)
+
+
+def test_tag_to_version_traces(capsys: pytest.CaptureFixture[str]) -> None:
+    tag_to_version("v1.2", c)
+    err = capsys.readouterr().err
+    assert "tag 'v1.2' parsed to" in err
+    assert "version pre parse v1.2" in err
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import dataclasses
 from datetime import date
+from datetime import datetime
 from datetime import timedelta
+from datetime import timezone
 from typing import Any
 
 import pytest
 
 from setuptools_scm import Configuration
+from setuptools_scm import Version as PkgVersion
+from setuptools_scm.version import callable_or_entrypoint
 from setuptools_scm.version import calver_by_date
 from setuptools_scm.version import format_version
+from setuptools_scm.version import get_no_local_node
 from setuptools_scm.version import guess_next_version
 from setuptools_scm.version import meta
 from setuptools_scm.version import no_guess_dev_version
@@ -214,6 +220,98 @@ def test_format_version_schemes() -> None:
     )
 
 
+@pytest.mark.parametrize("version_scheme", ["guess-next-dev", ["guess-next-dev"]])
+@pytest.mark.parametrize(
+    "local_scheme, expected",
+    [("no-local-version", "1.1.dev2"), ("node-and-date", "1.1.dev2+gabc")],
+)
+def test_format_version_scheme_values(
+    version_scheme: Any, local_scheme: str, expected: str
+) -> None:
+    version = meta("1.0", distance=2, node="gabc", config=c)
+    for _ in range(2):
+        result = format_version(
+            version, version_scheme=version_scheme, local_scheme=local_scheme
+        )
+        assert result == expected
+
+
+def test_format_version_unhashable_callable_scheme() -> None:
+    @dataclasses.dataclass
+    class Scheme:
+        suffix: str
+
+        def __call__(self, version: ScmVersion) -> str:
+            return version.format_with("{tag}" + self.suffix)
+
+    version = meta("1.0", config=c)
+    result = format_version(
+        version, version_scheme=Scheme(".post0"), local_scheme="no-local-version"
+    )
+    assert result == "1.0.post0"
+
+
+def test_format_version_fallback_schemes_load_lazily(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from setuptools_scm import _entrypoints
+
+    def broken_ep(group: str, name: str) -> None:
+        raise ImportError(name)
+
+    monkeypatch.setattr(_entrypoints, "_get_ep", broken_ep)
+    result = format_version(
+        meta("1.0", config=c),
+        version_scheme=[lambda v: "1.0", "broken-scheme"],
+        local_scheme=get_no_local_node,
+    )
+    assert result == "1.0"
+
+
+def test_format_version_calls_custom_schemes_each_time() -> None:
+    calls = []
+
+    def scheme(version: ScmVersion) -> str:
+        calls.append(version)
+        return "1.0"
+
+    version = meta("1.0", config=c)
+    for _ in range(2):
+        format_version(version, version_scheme=scheme, local_scheme="no-local-version")
+    assert calls == [version, version]
+
+
+def test_format_version_calver_warns_each_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+    for _ in range(2):
+        version = meta("1.0", distance=2, config=c)
+        with pytest.warns(UserWarning, match="not correspond to a valid versioning"):
+            format_version(
+                version,
+                version_scheme="calver-by-date",
+                local_scheme="no-local-version",
+            )
+
+
+def test_format_version_local_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+
+    def fmt(version: ScmVersion) -> str:
+        return format_version(
+            version, version_scheme="guess-next-dev", local_scheme="node-and-date"
+        )
+
+    assert fmt(meta("1.0", distance=2, node="gabc", config=c)) == "1.1.dev2+gabc"
+    assert fmt(meta("1.0", distance=2, node="gabc", config=c)) == "1.1.dev2+gabc"
+    dirty = meta("1.0", distance=2, node="gabc", dirty=True, config=c)
+    assert fmt(dirty) == "1.1.dev2+gabc.d19700101"
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "86400")
+    dirty = meta("1.0", distance=2, node="gabc", dirty=True, config=c)
+    assert fmt(dirty) == "1.1.dev2+gabc.d19700102"
+
+
 def date_to_str(
     date_: date | None = None,
     days_offset: int = 0,
@@ -344,3 +442,44 @@ def test_custom_version_cls() -> None:
 
     assert isinstance(scm_version.tag, MyVersion)
     assert str(scm_version.tag) == "Custom 1.0.0-foo"
+
+
+def test_tag_str_matches_tag() -> None:
+    version = meta("v1.0.0-rc.1", distance=2, config=c)
+    assert version.tag_str == str(version.tag) == "1.0.0rc1"
+
+
+def test_callable_or_entrypoint() -> None:
+    group = "setuptools_scm.version_scheme"
+    assert callable_or_entrypoint(group, calver_by_date) is calver_by_date
+    assert callable_or_entrypoint(group, "calver-by-date") is calver_by_date
+    assert callable_or_entrypoint(group, "no-such-scheme") is None
+
+
+def test_source_date_epoch_follows_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+    assert meta("1.0", config=c).time == datetime(1970, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "86400")
+    assert meta("1.0", config=c).time == datetime(1970, 1, 2, tzinfo=timezone.utc)
+
+
+def test_schemes_follow_mutated_fields() -> None:
+    version = meta("1.0", distance=2, branch="main", config=c)
+    assert guess_next_version(version) == "1.1"
+    assert release_branch_semver_version(version) == "1.1.0.dev2"
+    version.tag = PkgVersion("2.0")
+    assert guess_next_version(version) == "2.1"
+    version.tag = PkgVersion("1.0")
+    version.branch = "release/1.0"
+    assert release_branch_semver_version(version) == "1.1.dev2"
+    assert [f.name for f in dataclasses.fields(version)] == [
+        "tag",
+        "config",
+        "distance",
+        "node",
+        "dirty",
+        "preformatted",
+        "branch",
+        "node_date",
+        "time",
+    ]